@@ -9,6 +9,10 @@ import time
 touch = touchio.TouchIn(board.A4)
 TOUCH_THRESHOLD = 17000  # You can fine-tune this
 
+# Stream each response to a host over a second USB serial port
+# (run host/stream_receiver.py on the computer). Works in both modes.
+STREAM_RESPONSES = False
+
 # LED for feedback (onboard)
 led = digitalio.DigitalInOut(board.LED)
 led.direction = digitalio.Direction.OUTPUT
@@ -24,10 +28,10 @@ def blink(n):
 if touch.raw_value < TOUCH_THRESHOLD:
     # Touched: enable CIRCUITPY (host access mode)
     storage.enable_usb_drive()
-    usb_cdc.enable(console=True, data=False)
+    usb_cdc.enable(console=True, data=STREAM_RESPONSES)
     blink(1)  # 🔓 1 blink = USB mode
 else:
     # Not touched: disable USB so device can write logs
     storage.disable_usb_drive()
-    usb_cdc.enable(console=True, data=False)
+    usb_cdc.enable(console=True, data=STREAM_RESPONSES)
     blink(2)  # ✏️ 2 blinks = Logging mode
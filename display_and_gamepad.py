@@ -4,17 +4,32 @@
 import board
 import terminalio
 import displayio
+import bitmaptools
 from adafruit_display_text import label
 import busio
 import time
+import math
+import array
 import rtc
-import os
 from adafruit_bus_device.i2c_device import I2CDevice
 import struct
+import usb_cdc
+import microcontroller
+from logger_storage import PCF8523Clock, SDCardBackend, FlashBackend
+from response_stream import ResponseStream
+from response_stats import ResponseStats
+from icon_sets import IconSet
+from idle_manager import IdleManager
 
 # ----- Configurable Constants -----
 BORDER = 10
 CSV_FILENAME = "/data_log.csv"
+USE_ADALOGGER = True        # Log to the Adalogger SD card when one is fitted
+SD_CS_PIN = board.D10       # Adalogger FeatherWing SD chip select
+# After each round: True = write every buffered row (one short, unaligned append),
+# False = write only whole 512 byte blocks; the rest waits in RAM and is lost on power loss
+SD_FLUSH_EACH_ROUND = True
+STATS_FILENAME = "stats.json"  # Running totals, saved next to the log once its rows are written
 
 # ----- Font and Scale -----
 FONT = terminalio.FONT
@@ -184,11 +199,13 @@ def show_welcome(text="Welcome! Press A to begin"):
     global last_button_state
     while True:
         button_state = read_buttons()
+        if consume_press(button_state):
+            continue
         if (button_state & (1 << BUTTON_MAPPING['A'])) and not (last_button_state & (1 << BUTTON_MAPPING['A'])):
             last_button_state = button_state
             return
         last_button_state = button_state
-        time.sleep(0.1)
+        poll_background(0.1)
 
 # ----- Transition Screen -----
 def show_transition(text="Next...", duration=0.5):
@@ -198,7 +215,7 @@ def show_transition(text="Next...", duration=0.5):
                            position=(display.width // 2 - 20, display.height // 2 - 5))
     splash.append(wait_label)
     display.root_group = splash
-    time.sleep(duration)
+    poll_background(duration)
   
 # ----- QWST Controller Functions -----
 i2c = busio.I2C(board.SCL, board.SDA)
@@ -214,6 +231,9 @@ BUTTON_MAPPING = {
     '+': 0xB, '-': 0x5
 }
 
+# Hold + and - together on any screen to open the admin dashboard
+ADMIN_CHORD = (1 << BUTTON_MAPPING['+']) | (1 << BUTTON_MAPPING['-'])
+
 led_state = 0b0000
 last_button_state = 0
 
@@ -263,17 +283,186 @@ def init_qwst():
     except OSError as e:
         print(f"Error initializing QwSTPad: {e}")
 
-# BINARY QUESTIONS
-def binary_question(variable_name, variable_code=None, left_label="YES", right_label="NO"):
+# ----- Storage Backend -----
+storage_backend = None
+
+def open_storage():
+    # The RTC shares the pad's I2C bus; fall back to the board clock without it
+    clock = None
     try:
+        clock = PCF8523Clock(i2c)
+        clock.sync_system_clock()
+    except (OSError, ValueError) as e:
+        print(f"⚠️ No PCF8523 RTC: {e}")
+        clock = None
+
+    if USE_ADALOGGER:
         try:
-            os.stat(CSV_FILENAME)
-        except OSError:
-            with open(CSV_FILENAME, "w") as f:
-                f.write("timestamp,variable,score\n")
+            return SDCardBackend(board.SPI(), SD_CS_PIN, clock=clock)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ No SD card, logging to flash: {e}")
+    return FlashBackend(CSV_FILENAME, clock=clock)
+
+# ----- Response Streaming -----
+# Only active when boot.py enabled the usb_cdc data port (STREAM_RESPONSES)
+response_stream = None
+
+def open_stream():
+    if usb_cdc.data is None:
+        return None
+    return ResponseStream(usb_cdc.data, device_id=microcontroller.cpu.uid)
+
+# ----- Idle Power Management -----
+# Slows polling, dims the backlight and light-sleeps when nobody presses anything
+idle_manager = None
+
+def poll_background(interval):
+    # Called from every wait loop instead of time.sleep(); the loops update
+    # last_button_state just before, so the idle manager sees every press
+    if response_stream is not None:
+        response_stream.poll()
+    idle_manager.wait(last_button_state, interval)
+
+# ----- Running Stats -----
+response_stats = None
+
+def open_stats():
+    stats = ResponseStats(storage_backend.sidecar_path(STATS_FILENAME))
+    stats.load()
+    return stats
+
+def log_response(variable_name, variable_code, score):
+    code = variable_code if variable_code else variable_name
+    timestamp = storage_backend.timestamp()
+    try:
+        storage_backend.write_row(timestamp, code, score)
+    except OSError as e:
+        print(f"⚠️ Could not write to file: {e}")
+    else:
+        # Stats only count rows that made it into the log
+        response_stats.add(code, score)
+    if response_stream is not None:
+        response_stream.send_response(timestamp, code, score)
+
+def flush_log():
+    try:
+        storage_backend.flush(partial=SD_FLUSH_EACH_ROUND)
     except OSError as e:
-        print(f"⚠️ Cannot access filesystem: {e}")
+        print(f"⚠️ Could not write to file: {e}")
+        return
+    # Only save the stats when every counted row is in the log, so the two
+    # agree after a power cut. With SD_FLUSH_EACH_ROUND = False that is only
+    # when the buffer happens to end on a block boundary.
+    if storage_backend.pending == 0:
+        response_stats.checkpoint()
+
+# ----- Admin Dashboard -----
+def draw_histogram(bitmap, variable):
+    bitmap.fill(0)
+    if variable is None or not variable.histogram:
+        return
+    scores = sorted(variable.histogram)
+    tallest = max(variable.histogram.values())
+    bar_width = max(1, bitmap.width // len(scores))
+    for i, score in enumerate(scores):
+        height = variable.histogram[score] * bitmap.height // tallest
+        if height:
+            bitmaptools.fill_region(bitmap, i * bar_width + 1, bitmap.height - height,
+                                    (i + 1) * bar_width - 1, bitmap.height, 1)
+
+admin_open = False
+
+def consume_press(button_state):
+    # Runs right after read_buttons() in every loop. True means the press was
+    # handled here, last_button_state is already up to date and the loop
+    # should skip straight to its next read.
+    global last_button_state
+    if button_state and not idle_manager.readable:
+        # The press that wakes a dark or sleeping screen is not an answer
+        idle_manager.activity()
+        last_button_state = button_state
+        return True
+    if (not admin_open and (button_state & ADMIN_CHORD) == ADMIN_CHORD
+            and (last_button_state & ADMIN_CHORD) != ADMIN_CHORD):
+        last_button_state = button_state
+        previous = display.root_group
+        show_admin()
+        display.root_group = previous
+        # last_button_state now holds whatever closed the dashboard (B or the
+        # chord), so a button still held down is not seen as a new press
+        return True
+    return False
+
+def show_admin():
+    # U/D steps through variables, B (or the +/- chord again) goes back
+    global admin_open
+    admin_open = True
+    try:
+        run_admin()
+    finally:
+        admin_open = False
+
+def run_admin():
+    splash = displayio.Group()
+    splash.append(make_rect(0, 0, display.width, display.height, BLACK))
+    title = make_text("", YELLOW, scale=SCALE_MED, position=(10, 8))
+    code_text = make_text("", WHITE, scale=SCALE_BIG, position=(10, 28))
+    detail_text = make_text("", LIGHT_GRAY, scale=SCALE_MED, position=(10, 50))
+    range_text = make_text("", LIGHT_GRAY, scale=SCALE_MED, position=(10, 64))
+    power_text = make_text("", LIGHT_GRAY, scale=SCALE_MED, position=(10, display.height - 8))
+    hist_bitmap = displayio.Bitmap(display.width - 20, display.height - 98, 2)
+    hist_palette = displayio.Palette(2)
+    hist_palette[0] = DARK_GRAY
+    hist_palette[1] = GREEN
+    for item in (title, code_text, detail_text, range_text, power_text):
+        splash.append(item)
+    splash.append(displayio.TileGrid(hist_bitmap, pixel_shader=hist_palette, x=10, y=78))
+    display.root_group = splash
+
+    codes = response_stats.codes()
+    selected = 0
+
+    def update_view():
+        title[0].text = f"Admin: {response_stats.total} responses, {len(codes)} variables"
+        power_text[0].text = f"Power ~{idle_manager.energy_mah():.1f} mAh since boot"
+        if not codes:
+            code_text[0].text = "No data yet"
+            detail_text[0].text = ""
+            range_text[0].text = ""
+            draw_histogram(hist_bitmap, None)
+            return
+        variable = response_stats.variables[codes[selected]]
+        code_text[0].text = codes[selected]
+        detail_text[0].text = f"{selected + 1}/{len(codes)}  n={variable.count}  mean={variable.mean:.2f}"
+        other = f"  other={variable.other}" if variable.other else ""
+        range_text[0].text = f"min={variable.minimum}  max={variable.maximum}{other}"
+        draw_histogram(hist_bitmap, variable)
+
+    update_view()
+
+    global last_button_state
+    while True:
+        button_state = read_buttons()
+        if consume_press(button_state):
+            continue
+        pressed = button_state & ~last_button_state
+        if (button_state & ADMIN_CHORD) == ADMIN_CHORD and (last_button_state & ADMIN_CHORD) != ADMIN_CHORD:
+            last_button_state = button_state
+            return
+        if pressed & (1 << BUTTON_MAPPING['B']):
+            last_button_state = button_state
+            return
+        if codes and pressed & (1 << BUTTON_MAPPING['D']):
+            selected = (selected + 1) % len(codes)
+            update_view()
+        elif codes and pressed & (1 << BUTTON_MAPPING['U']):
+            selected = (selected - 1) % len(codes)
+            update_view()
+        last_button_state = button_state
+        poll_background(0.1)
 
+# BINARY QUESTIONS
+def binary_question(variable_name, variable_code=None, left_label="YES", right_label="NO"):
     splash = displayio.Group()
     splash.append(make_gradient(display.width, display.height, BLACK, DARK_GRAY))
     display.root_group = splash
@@ -311,6 +500,8 @@ def binary_question(variable_name, variable_code=None, left_label="YES", right_l
 
     while True:
         button_state = read_buttons()
+        if consume_press(button_state):
+            continue
 
         for button, bit_pos in BUTTON_MAPPING.items():
             if (button_state & (1 << bit_pos)) and not (last_button_state & (1 << bit_pos)):
@@ -322,33 +513,25 @@ def binary_question(variable_name, variable_code=None, left_label="YES", right_l
                     selected = 0
                     selector_outline.x = 0
                 elif button == 'A':
-                    now = time.localtime()
-                    timestamp = str(time.mktime(now))
                     score = 1 if selected == 0 else 0  # 1 = left, 0 = right
-                    try:
-                        code = variable_code if variable_code else variable_name
-                        with open(CSV_FILENAME, "a") as f:
-                            f.write(f"{timestamp},{code},{score}\n")
-                        last_button_state = button_state
-                        return
-                    except OSError as e:
-                        print(f"⚠️ Could not write to file: {e}")
-                        last_button_state = button_state
-                        return
+                    log_response(variable_name, variable_code, score)
+                    last_button_state = button_state
+                    return
 
         last_button_state = button_state
-        time.sleep(debounce_time)
+        poll_background(debounce_time)
 
 # ----- Emoji Selection Flow -----
-def emoji_question(variable_name, min_score, max_score, variable_code=None):
-    try:
+def emoji_question(variable_name, min_score, max_score, variable_code=None, icon_set=None):
+    # icon_set: name of a folder in /icons (see icon_sets.py) to use instead of faces
+    icons = None
+    if icon_set:
         try:
-            os.stat(CSV_FILENAME)
-        except OSError:
-            with open(CSV_FILENAME, "w") as f:
-                f.write("timestamp,variable,score")
-    except OSError as e:
-        print(f"⚠️ Cannot access filesystem: {e}")
+            icons = IconSet(icon_set)
+            icons.load()
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠️ Cannot load icon set {icon_set}: {e}")
+            icons = None
 
     splash = displayio.Group()
     splash.append(make_gradient(display.width, display.height, NAVY, SKY_BLUE))
@@ -373,34 +556,53 @@ def emoji_question(variable_name, min_score, max_score, variable_code=None):
     spacing = display.width // count
     y_pos = display.height // 2
 
+    # Labels under faces
+    face_labels = {
+        "very_sad": "Very Sad",
+        "sad": "Sad",
+        "neutral": "Okay",
+        "happy": "Happy",
+        "very_happy": "Very Happy"
+    }
+
+    if icons is not None:
+        icon_indices = icons.pick(count)
+        face_width = icons.tile_width
+        y_pos = (display.height - icons.tile_height) // 2 + 5
+        label_y = y_pos + icons.tile_height + 6
+    else:
+        face_width = 36
+        label_y = y_pos + 40
+
     emoji_labels = []
     for i in range(count):
-        face_type = face_types[i]
-        x = spacing * i + spacing // 2 - 18  # Adjusted to center 36px-wide emoji
-        face_group = make_face_bitmap(face_type)
-        face_group.x = x
-        face_group.y = y_pos
+        x = spacing * i + spacing // 2 - face_width // 2  # Centre the 36px emoji or the icon tile
+        if icons is not None:
+            # Only the sheet for this set gets loaded, and only now
+            face_group = icons.sprite(icon_indices[i], x, y_pos)
+            label_text = icons.label(icon_indices[i])
+        else:
+            face_type = face_types[i]
+            face_group = make_face_bitmap(face_type)
+            face_group.x = x
+            face_group.y = y_pos
+            label_text = face_labels.get(face_type, "?")
         emoji_group.append(face_group)
         emoji_labels.append(face_group)
 
-        # Label under face
-        face_labels = {
-            "very_sad": "Very Sad",
-            "sad": "Sad",
-            "neutral": "Okay",
-            "happy": "Happy",
-            "very_happy": "Very Happy"
-        }
-        label_text = face_labels.get(face_type, "?")
-        label_y = y_pos + 40
-        label_x = x + 18 - len(label_text) * 3  # Center label under 36px emoji
+        label_x = x + face_width // 2 - len(label_text) * 3  # Center label under emoji
         emoji_label = make_text(label_text, WHITE, scale=SCALE_SMALL, position=(label_x, label_y))
         emoji_group.append(emoji_label)
 
     # Selection Box
-    box_width = 38  # Slightly larger to pad 3x scale
-    box_height = 38
-    box_y = y_pos - 10  # Align better with scaled emoji face
+    if icons is not None:
+        box_width = icons.tile_width + 6
+        box_height = icons.tile_height + 6
+        box_y = y_pos - 3
+    else:
+        box_width = 38  # Slightly larger to pad 3x scale
+        box_height = 38
+        box_y = y_pos - 10  # Align better with scaled emoji face
     selector = make_rect(spacing // 2 - box_width // 2, box_y, box_width, box_height, RED)
     emoji_group.insert(0, selector)
 
@@ -413,6 +615,8 @@ def emoji_question(variable_name, min_score, max_score, variable_code=None):
 
     while True:
         button_state = read_buttons()
+        if consume_press(button_state):
+            continue
 
         for button, bit_pos in BUTTON_MAPPING.items():
             if (button_state & (1 << bit_pos)) and not (last_button_state & (1 << bit_pos)):
@@ -422,36 +626,18 @@ def emoji_question(variable_name, min_score, max_score, variable_code=None):
                 elif button == 'L' and selected_index > 0:
                     selected_index -= 1
                 elif button == 'A':
-                    now = time.localtime()
-                    timestamp = str(time.mktime(now))
-                    try:
-                        code = variable_code if variable_code else variable_name
-                        with open(CSV_FILENAME, "a") as f:
-                            f.write(f"{timestamp},{code},{selected_index + min_score}")
-                        last_button_state = button_state
-                        return
-                    except OSError as e:
-                        print(f"⚠️ Could not write to file: {e}")
-                        last_button_state = button_state
-                        return
+                    log_response(variable_name, variable_code, selected_index + min_score)
+                    last_button_state = button_state
+                    return
 
                 selector.x = spacing * selected_index + spacing // 2 - box_width // 2
 
         last_button_state = button_state
-        time.sleep(debounce_time)
+        poll_background(debounce_time)
 
 
 # ----- Volume Bar Question -----
 def volume_question(variable_name, max_level=6, variable_code=None):
-    try:
-        try:
-            os.stat(CSV_FILENAME)
-        except OSError:
-            with open(CSV_FILENAME, "w") as f:
-                f.write("timestamp,variable,score")
-    except OSError as e:
-        print(f"⚠️ Cannot access filesystem: {e}")
-
     splash = displayio.Group()
     splash.append(make_gradient(display.width, display.height, BLACK, DARK_GRAY))
     display.root_group = splash
@@ -489,6 +675,8 @@ def volume_question(variable_name, max_level=6, variable_code=None):
 
     while True:
         button_state = read_buttons()
+        if consume_press(button_state):
+            continue
 
         for button, bit_pos in BUTTON_MAPPING.items():
             if (button_state & (1 << bit_pos)) and not (last_button_state & (1 << bit_pos)):
@@ -497,36 +685,18 @@ def volume_question(variable_name, max_level=6, variable_code=None):
                 elif button == 'L' and score > 0:
                     score -= 1
                 elif button == 'A':
-                    now = time.localtime()
-                    timestamp = str(time.mktime(now))
-                    try:
-                        code = variable_code if variable_code else variable_name
-                        with open(CSV_FILENAME, "a") as f:
-                            f.write(f"{timestamp},{code},{score}")
-                        last_button_state = button_state
-                        return
-                    except OSError as e:
-                        print(f"⚠️ Could not write to file: {e}")
-                        last_button_state = button_state
-                        return
+                    log_response(variable_name, variable_code, score)
+                    last_button_state = button_state
+                    return
 
                 update_bars(score)
 
         last_button_state = button_state
-        time.sleep(debounce_time)
+        poll_background(debounce_time)
 
 # ----- Question Flow -----
 def progress_question(variable_name, min_score, max_score, variable_code=None,
                       bar_color_1=WHITE, bar_color_2=RED):
-    try:
-        try:
-            os.stat(CSV_FILENAME)
-        except OSError:
-            with open(CSV_FILENAME, "w") as f:
-                f.write("timestamp,variable,score\n")
-    except OSError as e:
-        print(f"⚠️ Cannot access filesystem: {e}")
-
     splash = displayio.Group()
     splash.append(make_gradient(display.width, display.height, SKY_BLUE, WHITE))
     display.root_group = splash
@@ -569,6 +739,8 @@ def progress_question(variable_name, min_score, max_score, variable_code=None,
 
     while True:
         button_state = read_buttons()
+        if consume_press(button_state):
+            continue
 
         for button, bit_pos in BUTTON_MAPPING.items():
             if (button_state & (1 << bit_pos)) and not (last_button_state & (1 << bit_pos)):
@@ -578,18 +750,9 @@ def progress_question(variable_name, min_score, max_score, variable_code=None,
                 elif button == 'L' and score > min_score:
                     score -= 1
                 elif button == 'A':
-                    now = time.localtime()
-                    timestamp = str(time.mktime(now))
-                    try:
-                        code = variable_code if variable_code else variable_name
-                        with open(CSV_FILENAME, "a") as f:
-                            f.write(f"{timestamp},{code},{score}\n")
-                        last_button_state = button_state
-                        return
-                    except OSError as e:
-                        print(f"⚠️ Could not write to file: {e}")
-                        last_button_state = button_state
-                        return
+                    log_response(variable_name, variable_code, score)
+                    last_button_state = button_state
+                    return
 
                 score_label[0].text = str(score)
 
@@ -600,11 +763,286 @@ def progress_question(variable_name, min_score, max_score, variable_code=None,
                         bar_fill_bitmap[x, y] = 1 if x < bar_width else 0
 
         last_button_state = button_state
-        time.sleep(debounce_time)
+        poll_background(debounce_time)
+
+# ----- Cell Grids (Grid Selector / Number Pad) -----
+# Every cell is its own one-colour TileGrid. Moving the cursor only recolours
+# the old and new cell palettes, so displayio refreshes just those two cells.
+def make_cell_grid(group, x, y, rows, cols, cell_width, cell_height, labels, color, text_color=BLACK):
+    cells = []
+    for row in range(rows):
+        for col in range(cols):
+            cell_x = x + col * cell_width
+            cell_y = y + row * cell_height
+            cell = make_rect(cell_x + 1, cell_y + 1, cell_width - 2, cell_height - 2, color)
+            group.append(cell)
+            cells.append(cell)
+            text = labels[row * cols + col] if labels else ""
+            if text:
+                group.append(make_text(text, text_color, scale=SCALE_SMALL,
+                                       position=(cell_x + cell_width // 2 - len(text) * 3,
+                                                 cell_y + cell_height // 2)))
+    return cells
+
+def move_highlight(cells, old_index, new_index, color, highlight):
+    if old_index != new_index:
+        cells[old_index].pixel_shader[0] = color
+    cells[new_index].pixel_shader[0] = highlight
+
+def move_cursor(index, button, rows, cols):
+    row, col = divmod(index, cols)
+    if button == 'U' and row > 0:
+        row -= 1
+    elif button == 'D' and row < rows - 1:
+        row += 1
+    elif button == 'L' and col > 0:
+        col -= 1
+    elif button == 'R' and col < cols - 1:
+        col += 1
+    return row * cols + col
+
+# ----- Grid Selector -----
+def grid_question(variable_name, rows=3, cols=3, variable_code=None,
+                  row_labels=None, col_labels=None, cell_labels=None):
+    # Logs the chosen cell as row * cols + col (0 = top left)
+    splash = displayio.Group()
+    splash.append(make_gradient(display.width, display.height, BLACK, DARK_GRAY))
+    display.root_group = splash
+
+    title = make_text(variable_name, WHITE, scale=SCALE_MED, position=(10, 8))
+    splash.append(title)
+
+    label_width = 6 * max(len(text) for text in row_labels) + 6 if row_labels else 0
+    grid_x = 4 + label_width
+    grid_y = 30 if col_labels else 20
+    cell_width = (display.width - grid_x - 4) // cols
+    cell_height = (display.height - grid_y - 4) // rows
+
+    if col_labels:
+        for col, text in enumerate(col_labels):
+            splash.append(make_text(text, LIGHT_GRAY, scale=SCALE_SMALL,
+                                    position=(grid_x + col * cell_width + cell_width // 2 - len(text) * 3,
+                                              grid_y - 8)))
+    if row_labels:
+        for row, text in enumerate(row_labels):
+            splash.append(make_text(text, LIGHT_GRAY, scale=SCALE_SMALL,
+                                    position=(4, grid_y + row * cell_height + cell_height // 2)))
+
+    grid_group = displayio.Group()
+    cells = make_cell_grid(grid_group, grid_x, grid_y, rows, cols, cell_width, cell_height,
+                           cell_labels, SKY_BLUE)
+    splash.append(grid_group)
+
+    selected = (rows // 2) * cols + cols // 2
+    move_highlight(cells, selected, selected, SKY_BLUE, ORANGE)
+
+    global last_button_state
+    debounce_time = 0.1
+
+    while True:
+        button_state = read_buttons()
+        if consume_press(button_state):
+            continue
+
+        for button, bit_pos in BUTTON_MAPPING.items():
+            if (button_state & (1 << bit_pos)) and not (last_button_state & (1 << bit_pos)):
+                if button == 'A':
+                    log_response(variable_name, variable_code, selected)
+                    last_button_state = button_state
+                    return
+
+                new_selected = move_cursor(selected, button, rows, cols)
+                if new_selected != selected:
+                    move_highlight(cells, selected, new_selected, SKY_BLUE, ORANGE)
+                    selected = new_selected
+
+        last_button_state = button_state
+        poll_background(debounce_time)
+
+# ----- Number Pad Entry -----
+NUMBER_PAD_KEYS = ["1", "2", "3", "4", "5", "6", "7", "8", "9", "DEL", "0", "OK"]
+
+def number_pad_question(variable_name, variable_code=None, max_digits=4):
+    # Arrows move, A presses the key, B clears, OK logs the number
+    splash = displayio.Group()
+    splash.append(make_gradient(display.width, display.height, NAVY, SKY_BLUE))
+    display.root_group = splash
+
+    title = make_text(variable_name, WHITE, scale=SCALE_MED, position=(10, 8))
+    splash.append(title)
+
+    value_text = make_text("_", YELLOW, scale=SCALE_BIG, position=(10, 35))
+    splash.append(value_text)
+
+    rows, cols = 4, 3
+    pad_width = display.width // 2
+    pad_x = display.width - pad_width - 4
+    pad_y = 20
+    cell_height = (display.height - pad_y - 4) // rows
+
+    pad_group = displayio.Group()
+    cells = make_cell_grid(pad_group, pad_x, pad_y, rows, cols, pad_width // cols, cell_height,
+                           NUMBER_PAD_KEYS, WHITE)
+    splash.append(pad_group)
+
+    selected = 0
+    move_highlight(cells, selected, selected, WHITE, ORANGE)
+    value = ""
+
+    global last_button_state
+    debounce_time = 0.1
+
+    while True:
+        button_state = read_buttons()
+        if consume_press(button_state):
+            continue
+
+        for button, bit_pos in BUTTON_MAPPING.items():
+            if (button_state & (1 << bit_pos)) and not (last_button_state & (1 << bit_pos)):
+                if button == 'A':
+                    key = NUMBER_PAD_KEYS[selected]
+                    if key == "OK":
+                        if value:
+                            log_response(variable_name, variable_code, int(value))
+                            last_button_state = button_state
+                            return
+                    elif key == "DEL":
+                        value = value[:-1]
+                    elif len(value) < max_digits:
+                        value = value + key if value != "0" else key
+                    value_text[0].text = value or "_"
+                elif button == 'B':
+                    value = ""
+                    value_text[0].text = "_"
+                else:
+                    new_selected = move_cursor(selected, button, rows, cols)
+                    if new_selected != selected:
+                        move_highlight(cells, selected, new_selected, WHITE, ORANGE)
+                        selected = new_selected
+
+        last_button_state = button_state
+        poll_background(debounce_time)
+
+# ----- Target Dial -----
+DIAL_REPEAT_DELAY = 0.4      # Hold L/R this long before auto-repeat starts
+DIAL_REPEAT_INTERVAL = 0.05  # Then step once per this many seconds
+DIAL_POLL = 0.02
+
+def make_dial_tables(steps, cx, cy, inner, outer):
+    # Pointer end points for every step, worked out once: [x0, y0, x1, y1] * steps
+    table = array.array("h", [0] * (steps * 4))
+    for i in range(steps):
+        # A single step has nowhere to turn, so its pointer stands straight up
+        angle = math.pi * (1 - i / (steps - 1)) if steps > 1 else math.pi / 2
+        c = math.cos(angle)
+        s = math.sin(angle)
+        table[i * 4] = cx + int(c * inner)
+        table[i * 4 + 1] = cy - int(s * inner)
+        table[i * 4 + 2] = cx + int(c * outer)
+        table[i * 4 + 3] = cy - int(s * outer)
+    return table
+
+def draw_dial_pointer(bitmap, table, index, color):
+    i = index * 4
+    x0, y0, x1, y1 = table[i], table[i + 1], table[i + 2], table[i + 3]
+    bitmaptools.draw_line(bitmap, x0, y0, x1, y1, color)
+    bitmaptools.draw_line(bitmap, x0 + 1, y0, x1 + 1, y1, color)
+    bitmaptools.draw_line(bitmap, x0, y0 - 1, x1, y1 - 1, color)
+
+def dial_question(variable_name, min_score=0, max_score=100, variable_code=None,
+                  step=1, start=None, tick_every=10):
+    # Thermostat-style arc; L/R turn the pointer (hold to auto-repeat), A confirms
+    splash = displayio.Group()
+    splash.append(make_gradient(display.width, display.height, NAVY, DARK_GRAY))
+    display.root_group = splash
+
+    title = make_text(variable_name, WHITE, scale=SCALE_MED, position=(10, 8))
+    splash.append(title)
+
+    radius = min(display.width // 2 - 20, display.height - 40)
+    width = 2 * radius + 24
+    height = radius + 14
+    cx = width // 2
+    cy = height - 2
+
+    dial_bitmap = displayio.Bitmap(width, height, 4)
+    dial_palette = displayio.Palette(4)
+    dial_palette[0] = BLACK
+    dial_palette.make_transparent(0)
+    dial_palette[1] = LIGHT_GRAY
+    dial_palette[2] = WHITE
+    dial_palette[3] = ORANGE
+
+    # Arc and ticks are drawn once; only the pointer changes afterwards
+    arc = make_dial_tables(4 * radius, cx, cy, radius, radius + 2)
+    for i in range(4 * radius):
+        bitmaptools.draw_line(dial_bitmap, arc[i * 4], arc[i * 4 + 1], arc[i * 4 + 2], arc[i * 4 + 3], 1)
+
+    steps = max(1, (max_score - min_score) // step + 1)
+    tick_steps = max(1, tick_every // step)
+    ticks = make_dial_tables(steps, cx, cy, radius + 5, radius + 10)
+    for i in range(0, steps, tick_steps):
+        bitmaptools.draw_line(dial_bitmap, ticks[i * 4], ticks[i * 4 + 1], ticks[i * 4 + 2], ticks[i * 4 + 3], 2)
+
+    pointer = make_dial_tables(steps, cx, cy, radius // 3, radius - 6)
+
+    dial_x = (display.width - width) // 2
+    dial_y = display.height - height
+    splash.append(displayio.TileGrid(dial_bitmap, pixel_shader=dial_palette, x=dial_x, y=dial_y))
+
+    value_text = make_text("", YELLOW, scale=SCALE_BIG, position=(dial_x + cx - 18, dial_y + cy - 14))
+    splash.append(value_text)
+
+    index = (steps - 1) // 2 if start is None else (start - min_score) // step
+    index = min(max(index, 0), steps - 1)  # a start outside the range sits at the nearest end
+    draw_dial_pointer(dial_bitmap, pointer, index, 3)
+    value_text[0].text = str(min_score + index * step)
+
+    left_bit = 1 << BUTTON_MAPPING['L']
+    right_bit = 1 << BUTTON_MAPPING['R']
+    confirm_bit = 1 << BUTTON_MAPPING['A']
+    repeat_at = 0
+
+    global last_button_state
+
+    while True:
+        button_state = read_buttons()
+        if consume_press(button_state):
+            continue
+        pressed = button_state & ~last_button_state
+
+        if pressed & confirm_bit:
+            log_response(variable_name, variable_code, min_score + index * step)
+            last_button_state = button_state
+            return
+
+        now = time.monotonic()
+        turn = 0
+        if pressed & (left_bit | right_bit):
+            turn = 1 if pressed & right_bit else -1
+            repeat_at = now + DIAL_REPEAT_DELAY
+        elif button_state & (left_bit | right_bit) and now >= repeat_at:
+            turn = 1 if button_state & right_bit else -1
+            repeat_at = now + DIAL_REPEAT_INTERVAL
+
+        new_index = index + turn
+        if turn and 0 <= new_index < steps:
+            # Erase the old pointer and draw the new one; nothing else is touched
+            draw_dial_pointer(dial_bitmap, pointer, index, 0)
+            draw_dial_pointer(dial_bitmap, pointer, new_index, 3)
+            index = new_index
+            value_text[0].text = str(min_score + index * step)
+
+        last_button_state = button_state
+        poll_background(DIAL_POLL)
 
 # ----- Init and Run Loop -----
 init_qwst()
 clear_leds()
+storage_backend = open_storage()
+response_stream = open_stream()
+response_stats = open_stats()
+idle_manager = IdleManager(display, touch_pin=board.A4)
 show_welcome("Press A to begin rating")
 
 
@@ -631,6 +1069,21 @@ while True:
 
     # 5-point emoji selection
     emoji_question("Emoji pick (5)", 0, 4, "emoji_5")
+    show_transition("Next: Grid", 0.75)
+
+    # 3x3 matrix question
+    grid_question("Importance vs urgency", 3, 3, "priority_grid",
+                  row_labels=["High", "Med", "Low"], col_labels=["Low", "Med", "High"])
+    show_transition("Next: Number", 0.75)
+
+    # Exact value entry
+    number_pad_question("How old are you?", "age", max_digits=3)
+    show_transition("Next: Dial", 0.75)
+
+    # 0-100 dial, hold L/R to turn quickly
+    dial_question("How warm do you feel?", 0, 100, "warmth")
+
+    flush_log()
 
     show_transition("Looping...", 1.0)
 Next
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+# FLEET LOG AGGREGATOR (runs on the host computer)
+#
+# Merges data_log.csv files copied off many Feathers into
+#   long.csv     device,timestamp,variable,score - one row per answer
+#   wide.csv     device,round,timestamp,<variable...> - one row per pass through the questions
+#   summary.csv  per-variable count, mean, std, min, max and score histogram
+#
+#   python3 host/aggregate_logs.py collected_logs/ --out merged/
+#
+# Files are streamed in fixed-size chunks, so memory does not grow with the
+# size of the logs. Older firmware wrote the header and some rows without a
+# trailing newline, e.g.
+#   timestamp,variable,score1718000000,emoji_2,11718000004,emoji_3,2
+# and those glued rows are split back apart. Exact re-copies of a log, and
+# copies that are just an earlier prefix of another log, are skipped.
+#
+# Needs NumPy (pip install -r host/requirements.txt).
+
+import argparse
+import csv
+import hashlib
+import os
+import re
+import sys
+
+import numpy as np
+
+TOKEN_SPLIT = re.compile(r"[,\r\n]+")
+READ_CHUNK = 1 << 20
+SUMMARY_CHUNK = 1 << 18
+HEAD_BYTES = 256
+MAX_GAP = 366 * 86400  # seconds between glued rows we accept without checking other splits
+
+
+# ----- Finding and de-duplicating logs -----
+def find_logs(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in sorted(files):
+                    if name.lower().endswith(".csv"):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def device_name(path):
+    # Logs copied as <device>/data_log.csv are named after their folder,
+    # stream_receiver.py output (<uid>.csv) after the file itself.
+    stem = os.path.splitext(os.path.basename(path))[0]
+    if stem.startswith("data_log"):
+        return os.path.basename(os.path.dirname(os.path.abspath(path))) or stem
+    return stem
+
+
+def _digest(path, limit=None):
+    sha = hashlib.sha1()
+    remaining = limit
+    with open(path, "rb") as f:
+        while remaining is None or remaining > 0:
+            size = READ_CHUNK if remaining is None else min(READ_CHUNK, remaining)
+            block = f.read(size)
+            if not block:
+                break
+            sha.update(block)
+            if remaining is not None:
+                remaining -= len(block)
+    return sha.digest()
+
+
+def unique_logs(paths):
+    """Drop exact duplicates and logs that are a prefix of a longer copy."""
+    seen = {}
+    for path in paths:
+        digest = _digest(path)
+        if digest not in seen:
+            seen[digest] = path
+
+    # Copies of the same log share their first bytes, so only logs with the
+    # same head need a prefix check. Tiny logs are checked against everything.
+    by_head = {}
+    small = []
+    for digest, path in seen.items():
+        size = os.path.getsize(path)
+        if size < HEAD_BYTES:
+            small.append((size, digest, path))
+        else:
+            by_head.setdefault(_digest(path, HEAD_BYTES), []).append((size, digest, path))
+
+    def is_prefix(size, digest, others):
+        return any(os.path.getsize(other) > size and _digest(other, size) == digest
+                   for other in others)
+
+    kept = []
+    skipped = len(paths) - len(seen)
+    for group in by_head.values():
+        group.sort(reverse=True)
+        longer = []
+        for size, digest, path in group:
+            if is_prefix(size, digest, longer):
+                skipped += 1
+                continue
+            longer.append(path)
+        kept.extend(longer)
+    small.sort(reverse=True)
+    for size, digest, path in small:
+        if is_prefix(size, digest, kept):
+            skipped += 1
+            continue
+        kept.append(path)
+    kept.sort()
+    return kept, skipped
+
+
+# ----- Parsing -----
+def iter_tokens(f, chunk_size=READ_CHUNK):
+    tail = ""
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        parts = TOKEN_SPLIT.split(tail + chunk)
+        tail = parts.pop()
+        for part in parts:
+            if part:
+                yield part
+    if tail:
+        yield tail
+
+
+def _is_int(token):
+    return token.lstrip("-").isdigit()
+
+
+def split_glued(token, timestamp):
+    """Split '<score><next timestamp>' at the point closest in time to the current row."""
+    # Usually the next timestamp has as many digits as this one
+    i = len(token) - len(str(timestamp))
+    if i > 0 and token[i] != "0" and _is_int(token[:i]) and abs(int(token[i:]) - timestamp) < MAX_GAP:
+        return int(token[:i]), token[i:]
+
+    best = None
+    for i in range(1, len(token)):
+        head, tail = token[:i], token[i:]
+        if tail[0] == "0" or not _is_int(head):
+            continue
+        gap = abs(int(tail) - timestamp)
+        if best is None or gap < best[0]:
+            best = (gap, int(head), tail)
+    if best is None:
+        raise ValueError(f"cannot split {token!r}")
+    return best[1], best[2]
+
+
+def iter_rows(f):
+    """Yield (timestamp, variable, score) from a log, repairing glued rows."""
+    tokens = iter_tokens(f)
+    pending = []
+
+    def take():
+        return pending.pop() if pending else next(tokens, None)
+
+    while True:
+        token = take()
+        if token is None:
+            return
+        if token == "timestamp":
+            # Header, possibly glued to the first timestamp as "score<ts>"
+            take()
+            last = take()
+            if last is not None and last.startswith("score") and len(last) > 5:
+                pending.append(last[5:])
+            continue
+        if not token.isdigit():
+            continue
+        timestamp = int(token)
+        variable = take()
+        score_token = take()
+        if score_token is None:
+            return
+        following = take()
+        try:
+            if following is not None and not _is_int(following) and following != "timestamp":
+                # The next token is a variable name, so the score token also
+                # carries the next row's timestamp
+                score, next_timestamp = split_glued(score_token, timestamp)
+                pending.append(following)
+                pending.append(next_timestamp)
+            else:
+                if following is not None:
+                    pending.append(following)
+                score = int(score_token)
+        except ValueError as e:
+            print(f"skipping bad row at {timestamp}: {e}", file=sys.stderr)
+            continue
+        yield timestamp, variable, score
+
+
+# ----- Summaries -----
+class SummaryAccumulator:
+    """Per-variable aggregates, updated from NumPy chunks of (variable id, score)."""
+
+    def __init__(self):
+        self.codes = {}
+        self.count = np.zeros(0, dtype=np.int64)
+        self.total = np.zeros(0, dtype=np.float64)
+        self.total_sq = np.zeros(0, dtype=np.float64)
+        self.minimum = np.zeros(0, dtype=np.int64)
+        self.maximum = np.zeros(0, dtype=np.int64)
+        self.histogram = {}
+        self._ids = []
+        self._scores = []
+
+    def add(self, variable, score):
+        var_id = self.codes.get(variable)
+        if var_id is None:
+            var_id = self.codes[variable] = len(self.codes)
+        self._ids.append(var_id)
+        self._scores.append(score)
+        if len(self._ids) >= SUMMARY_CHUNK:
+            self.flush()
+
+    def _grow(self):
+        extra = len(self.codes) - len(self.count)
+        if extra <= 0:
+            return
+        self.count = np.concatenate([self.count, np.zeros(extra, dtype=np.int64)])
+        self.total = np.concatenate([self.total, np.zeros(extra)])
+        self.total_sq = np.concatenate([self.total_sq, np.zeros(extra)])
+        info = np.iinfo(np.int64)
+        self.minimum = np.concatenate([self.minimum, np.full(extra, info.max, dtype=np.int64)])
+        self.maximum = np.concatenate([self.maximum, np.full(extra, info.min, dtype=np.int64)])
+
+    def flush(self):
+        if not self._ids:
+            return
+        ids = np.asarray(self._ids, dtype=np.int64)
+        scores = np.asarray(self._scores, dtype=np.int64)
+        self._ids = []
+        self._scores = []
+        self._grow()
+
+        n = len(self.codes)
+        values = scores.astype(np.float64)
+        self.count += np.bincount(ids, minlength=n)
+        self.total += np.bincount(ids, weights=values, minlength=n)
+        self.total_sq += np.bincount(ids, weights=values * values, minlength=n)
+
+        order = np.argsort(ids, kind="stable")
+        ids, scores = ids[order], scores[order]
+        starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+        present = ids[starts]
+        self.minimum[present] = np.minimum(self.minimum[present], np.minimum.reduceat(scores, starts))
+        self.maximum[present] = np.maximum(self.maximum[present], np.maximum.reduceat(scores, starts))
+
+        pairs, counts = np.unique(np.stack([ids, scores]), axis=1, return_counts=True)
+        for (var_id, score), n_score in zip(pairs.T.tolist(), counts.tolist()):
+            key = (var_id, score)
+            self.histogram[key] = self.histogram.get(key, 0) + n_score
+
+    def rows(self):
+        self.flush()
+        mean = self.total / np.maximum(self.count, 1)
+        std = np.sqrt(np.maximum(self.total_sq / np.maximum(self.count, 1) - mean * mean, 0))
+        bins = {}
+        for (var_id, score), n in sorted(self.histogram.items()):
+            bins.setdefault(var_id, []).append(f"{score}:{n}")
+        for code, var_id in sorted(self.codes.items()):
+            yield (code, int(self.count[var_id]), round(float(mean[var_id]), 4),
+                   round(float(std[var_id]), 4), int(self.minimum[var_id]),
+                   int(self.maximum[var_id]), ";".join(bins.get(var_id, [])))
+
+
+# ----- Output -----
+def write_long(logs, out_path, summary):
+    rows = 0
+    with open(out_path, "w", newline="") as out:
+        writer = csv.writer(out)
+        writer.writerow(["device", "timestamp", "variable", "score"])
+        for path in logs:
+            device = device_name(path)
+            with open(path, "r", encoding="utf-8", errors="replace", newline="") as f:
+                for timestamp, variable, score in iter_rows(f):
+                    writer.writerow((device, timestamp, variable, score))
+                    summary.add(variable, score)
+                    rows += 1
+    return rows
+
+
+def write_wide(long_path, out_path, codes):
+    # A new round starts whenever a device repeats a variable it already answered
+    rounds = 0
+    with open(long_path, "r", newline="") as f, open(out_path, "w", newline="") as out:
+        reader = csv.reader(f)
+        next(reader)
+        writer = csv.writer(out)
+        writer.writerow(["device", "round", "timestamp"] + codes)
+
+        device, current, start, number = None, {}, None, 0
+
+        def emit():
+            writer.writerow([device, number, start] + [current.get(code, "") for code in codes])
+
+        for row_device, timestamp, variable, score in reader:
+            if row_device != device or variable in current:
+                if current:
+                    emit()
+                    rounds += 1
+                number = number + 1 if row_device == device else 1
+                device, current, start = row_device, {}, timestamp
+            current[variable] = score
+        if current:
+            emit()
+            rounds += 1
+    return rounds
+
+
+def aggregate(paths, out_dir):
+    os.makedirs(out_dir, exist_ok=True)
+    logs, skipped = unique_logs(list(find_logs(paths)))
+    summary = SummaryAccumulator()
+    long_path = os.path.join(out_dir, "long.csv")
+    rows = write_long(logs, long_path, summary)
+
+    summary_rows = list(summary.rows())
+    with open(os.path.join(out_dir, "summary.csv"), "w", newline="") as out:
+        writer = csv.writer(out)
+        writer.writerow(["variable", "count", "mean", "std", "min", "max", "histogram"])
+        writer.writerows(summary_rows)
+
+    codes = [row[0] for row in summary_rows]
+    rounds = write_wide(long_path, os.path.join(out_dir, "wide.csv"), codes)
+    return {"files": len(logs), "skipped": skipped, "rows": rows, "rounds": rounds,
+            "variables": len(codes)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge QWST data_log.csv files from many devices")
+    parser.add_argument("paths", nargs="+", help="log files or folders of logs")
+    parser.add_argument("--out", default="merged", help="output directory")
+    args = parser.parse_args()
+
+    result = aggregate(args.paths, args.out)
+    print(f"{result['files']} logs ({result['skipped']} duplicates skipped), "
+          f"{result['rows']} rows, {result['rounds']} rounds, {result['variables']} variables "
+          f"-> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# BENCHMARK FOR aggregate_logs.py
+#
+# Writes synthetic device logs in the formats the firmware has produced
+# (newline-terminated rows and the older glued rows), adds re-copied and
+# prefix copies, then times the aggregation.
+#
+#   python3 host/bench_aggregate.py --devices 20 --rows 200000
+
+import argparse
+import os
+import random
+import resource
+import shutil
+import tempfile
+import time
+
+from aggregate_logs import aggregate
+
+QUESTIONS = [
+    ("volume_1", 0, 6, False),
+    ("plain_scale", 0, 5, True),
+    ("cheese_yn", 0, 1, True),
+    ("emoji_2", 0, 1, False),
+    ("emoji_3", 0, 2, False),
+    ("emoji_5", 0, 4, False),
+]
+
+
+def write_device_log(path, rows, seed):
+    # Glued rows are written the way emoji/volume questions used to: no newline
+    rng = random.Random(seed)
+    timestamp = 1718000000 + rng.randrange(86400)
+    parts = ["timestamp,variable,score"]
+    written = 0
+    with open(path, "w") as f:
+        while written < rows:
+            for code, low, high, newline in QUESTIONS:
+                timestamp += rng.randrange(2, 20)
+                parts.append(f"{timestamp},{code},{rng.randint(low, high)}")
+                if newline:
+                    parts.append("\n")
+                written += 1
+            if len(parts) > 4096:
+                f.write("".join(parts))
+                parts = []
+        f.write("".join(parts))
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the fleet log aggregator")
+    parser.add_argument("--devices", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=200000, help="rows per device")
+    parser.add_argument("--keep", action="store_true", help="keep the generated files")
+    args = parser.parse_args()
+
+    work = tempfile.mkdtemp(prefix="qwst_bench_")
+    logs = os.path.join(work, "logs")
+    try:
+        total = 0
+        start = time.perf_counter()
+        for i in range(args.devices):
+            device_dir = os.path.join(logs, f"feather_{i:02d}")
+            os.makedirs(device_dir)
+            total += write_device_log(os.path.join(device_dir, "data_log.csv"), args.rows, i)
+        # One exact re-copy and one copy taken earlier in the day (a prefix)
+        first = os.path.join(logs, "feather_00", "data_log.csv")
+        shutil.copy(first, os.path.join(logs, "feather_00", "data_log (copy).csv"))
+        with open(first, "rb") as src, open(os.path.join(logs, "feather_00", "data_log_morning.csv"), "wb") as dst:
+            dst.write(src.read(os.path.getsize(first) // 3))
+        generated = time.perf_counter() - start
+        size_mb = sum(os.path.getsize(os.path.join(root, name))
+                      for root, _, files in os.walk(logs) for name in files) / 1e6
+        print(f"generated {total:,} rows in {args.devices} logs ({size_mb:.1f} MB) in {generated:.1f}s")
+
+        start = time.perf_counter()
+        result = aggregate([logs], os.path.join(work, "merged"))
+        elapsed = time.perf_counter() - start
+        peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(f"aggregated {result['rows']:,} rows from {result['files']} logs "
+              f"({result['skipped']} duplicates skipped) in {elapsed:.1f}s "
+              f"= {result['rows'] / elapsed:,.0f} rows/s, peak RSS {peak_mb:.0f} MB")
+        if result["rows"] != total:
+            print(f"row count mismatch: expected {total:,}")
+    finally:
+        if args.keep:
+            print(f"files kept in {work}")
+        else:
+            shutil.rmtree(work)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# ICON SET PACKER (runs on the host computer)
+#
+# Turns a folder of PNGs into an icon set for icon_sets.py: one palette-indexed
+# sprite sheet plus iconset.json. Copy the output folder to CIRCUITPY/icons/.
+#
+#   python3 host/pack_icons.py pngs/pain/ --name pain --size 36 --colors 16
+#   python3 host/pack_icons.py a.png b.png c.png --name food --labels "None,Half,Full" --format rle
+#
+# Icons are ordered by file name (or command line order) and labelled with the
+# file name unless --labels is given. Transparent PNG pixels become palette
+# index 0, which is marked transparent on the device.
+#
+# bmp  - 8-bit indexed BMP, shown straight from flash with OnDiskBitmap (no RAM)
+# rle  - QRLE run-length file, usually smaller on flash, decoded into RAM on use
+#
+# Needs Pillow (pip install -r host/requirements.txt).
+
+import argparse
+import json
+import os
+import struct
+
+from PIL import Image
+
+RLE_MAGIC = b"QRLE"
+RLE_HEADER = "<4sBBBBHH"
+NO_TRANSPARENCY = 255
+ALPHA_CUTOFF = 128
+
+
+def load_icons(paths, size):
+    icons = []
+    for path in paths:
+        image = Image.open(path).convert("RGBA")
+        image.thumbnail((size, size), Image.LANCZOS)
+        tile = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+        tile.paste(image, ((size - image.width) // 2, (size - image.height) // 2))
+        icons.append(tile)
+    return icons
+
+
+def build_sheet(icons, size, colors):
+    """Lay the icons side by side and reduce them to one shared palette.
+
+    Returns (width, height, pixel indices, [(r, g, b)...], transparent index or None).
+    """
+    sheet = Image.new("RGBA", (size * len(icons), size), (0, 0, 0, 0))
+    for i, icon in enumerate(icons):
+        sheet.paste(icon, (i * size, 0))
+
+    alpha = sheet.getchannel("A").tobytes()
+    transparent = any(a < ALPHA_CUTOFF for a in alpha)
+    opaque_colors = colors - 1 if transparent else colors
+
+    quantized = sheet.convert("RGB").quantize(colors=opaque_colors, dither=Image.Dither.NONE)
+    flat = quantized.getpalette()[:opaque_colors * 3]
+    palette = [tuple(flat[i:i + 3]) for i in range(0, len(flat), 3)]
+    pixels = list(quantized.tobytes())
+
+    if transparent:
+        # Shift everything up one so index 0 can be the see-through colour
+        palette = [(0, 0, 0)] + palette
+        pixels = [0 if a < ALPHA_CUTOFF else p + 1 for p, a in zip(pixels, alpha)]
+    return sheet.width, sheet.height, pixels, palette, 0 if transparent else None
+
+
+def write_bmp(path, width, height, pixels, palette):
+    image = Image.new("P", (width, height))
+    flat = [c for rgb in palette for c in rgb]
+    image.putpalette(flat + [0] * (768 - len(flat)))
+    image.putdata(pixels)
+    image.save(path, format="BMP")
+
+
+def encode_rle(width, height, pixels, palette, transparent):
+    out = bytearray(struct.pack(RLE_HEADER, RLE_MAGIC, 1, len(palette),
+                                NO_TRANSPARENCY if transparent is None else transparent,
+                                0, width, height))
+    for rgb in palette:
+        out.extend(rgb)
+    for y in range(height):
+        row = pixels[y * width:(y + 1) * width]
+        x = 0
+        while x < width:
+            value = row[x]
+            run = 1
+            while x + run < width and run < 255 and row[x + run] == value:
+                run += 1
+            out.extend((run, value))
+            x += run
+    return bytes(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack PNG icons into a QWST icon set")
+    parser.add_argument("inputs", nargs="+", help="PNG files, or a folder of PNGs")
+    parser.add_argument("--name", required=True, help="icon set name, e.g. pain")
+    parser.add_argument("--out", default="icons", help="folder to write <name>/ into")
+    parser.add_argument("--size", type=int, default=36, help="tile size in pixels")
+    parser.add_argument("--colors", type=int, default=16, help="palette size (max 256, or 255 for rle)")
+    parser.add_argument("--labels", help="comma separated labels, one per icon")
+    parser.add_argument("--format", choices=("bmp", "rle"), default="bmp")
+    args = parser.parse_args()
+
+    paths = []
+    for item in args.inputs:
+        if os.path.isdir(item):
+            paths.extend(os.path.join(item, name) for name in sorted(os.listdir(item))
+                         if name.lower().endswith(".png"))
+        else:
+            paths.append(item)
+    if not paths:
+        parser.error("no PNG files found")
+    if not 2 <= args.colors <= 256:
+        parser.error("--colors must be between 2 and 256")
+    if args.format == "rle" and args.colors > 255:
+        # The QRLE header stores the palette size in one byte
+        parser.error("--format rle supports at most 255 colours")
+
+    if args.labels:
+        labels = [text.strip() for text in args.labels.split(",")]
+        if len(labels) != len(paths):
+            parser.error(f"{len(labels)} labels for {len(paths)} icons")
+    else:
+        labels = [os.path.splitext(os.path.basename(path))[0] for path in paths]
+
+    width, height, pixels, palette, transparent = build_sheet(
+        load_icons(paths, args.size), args.size, args.colors)
+
+    out_dir = os.path.join(args.out, args.name)
+    os.makedirs(out_dir, exist_ok=True)
+    if args.format == "bmp":
+        sheet_name = "sheet.bmp"
+        write_bmp(os.path.join(out_dir, sheet_name), width, height, pixels, palette)
+    else:
+        sheet_name = "sheet.qrle"
+        with open(os.path.join(out_dir, sheet_name), "wb") as f:
+            f.write(encode_rle(width, height, pixels, palette, transparent))
+
+    meta = {"file": sheet_name, "tile_width": args.size, "tile_height": args.size,
+            "count": len(paths), "labels": labels, "transparent": transparent}
+    with open(os.path.join(out_dir, "iconset.json"), "w") as f:
+        json.dump(meta, f, indent=1)
+
+    sheet_bytes = os.path.getsize(os.path.join(out_dir, sheet_name))
+    print(f"{len(paths)} icons, {len(palette)} colours -> {out_dir}/{sheet_name} ({sheet_bytes} bytes)")
+
+
+if __name__ == "__main__":
+    main()
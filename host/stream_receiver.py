@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# STREAM RECEIVER (runs on the host computer)
+#
+# Reads the framed responses a QWST Feather sends over its usb_cdc data port
+# (see response_stream.py) and appends them to a CSV with the same columns as
+# the on-device data_log.csv. One thread per serial port, one CSV per device.
+#
+#   python3 host/stream_receiver.py --port /dev/cu.usbmodem2103 --port /dev/cu.usbmodem2203
+#
+# Needs pyserial (pip install -r host/requirements.txt). The data port is the
+# second CDC interface the board exposes; the first one is the REPL console.
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+import serial
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from response_stream import (  # noqa: E402
+    FrameParser, decode_hello, decode_response, encode_frame, SEQ_MASK,
+    TYPE_DATA, TYPE_HELLO, TYPE_ACK, TYPE_NAK, TYPE_SYNC,
+)
+
+CSV_HEADER = "timestamp,variable,score\n"
+RECONNECT_DELAY = 1.0  # seconds between attempts to reopen a port that went away
+
+
+class DeviceReceiver:
+    """Track the sequence numbers of one device and write its rows in order."""
+
+    def __init__(self, port, out_dir, baudrate=115200):
+        self.port = port
+        self.out_dir = out_dir
+        self.baudrate = baudrate
+        self.serial = None  # opened in run(), reopened after the device resets or is unplugged
+        self.parser = FrameParser()
+        self.expected = None  # next wire sequence number, None until HELLO
+        self.session = None   # HELLO session of the device, changes when it reboots
+        self.out = None
+        self.received = 0
+        self.duplicates = 0
+
+    def _open_output(self, device_id):
+        name = device_id.hex() if device_id else os.path.basename(self.port)
+        path = os.path.join(self.out_dir, f"{name}.csv")
+        if self.out is not None and self.out.name == path:
+            return
+        if self.out is not None:
+            self.out.close()
+        new_file = not os.path.exists(path)
+        self.out = open(path, "a", newline="")
+        if new_file:
+            self.out.write(CSV_HEADER)
+            self.out.flush()
+        print(f"{self.port}: writing {path}")
+
+    def _send(self, frame_type, seq):
+        self.serial.write(encode_frame(frame_type, seq))
+
+    def handle(self, frame_type, seq, payload):
+        if frame_type == TYPE_HELLO:
+            session, device_id = decode_hello(payload)
+            if session == self.session and self.expected is not None:
+                # Same boot: the HELLO answers our SYNC or a NAK and may be
+                # older than what we already wrote, so only ever move forward
+                if 0 < (seq - self.expected) & SEQ_MASK < 0x8000:
+                    self.expected = seq
+                return
+            self._open_output(device_id)
+            self.session = session
+            self.expected = seq
+            return
+        if frame_type != TYPE_DATA:
+            return
+        if self.expected is None:
+            # Started listening mid-session: ask where the window begins
+            self._send(TYPE_SYNC, 0)
+            return
+
+        ahead = (seq - self.expected) & SEQ_MASK
+        if ahead == 0:
+            timestamp, code, score = decode_response(payload)
+            self.out.write(f"{timestamp},{code},{score}\n")
+            self.out.flush()
+            self.received += 1
+            self.expected = (seq + 1) & SEQ_MASK
+            self._send(TYPE_ACK, seq)
+        elif ahead < 0x8000:
+            # A frame went missing; ask for a resend from the gap
+            self._send(TYPE_NAK, self.expected)
+        else:
+            # Resent frame we already wrote; re-acknowledge so the device moves on
+            self.duplicates += 1
+            self._send(TYPE_ACK, (self.expected - 1) & SEQ_MASK)
+
+    def _connect(self):
+        self.serial = serial.Serial(self.port, self.baudrate, timeout=0.2)
+        # Drop any half frame from before; expected and session are kept so
+        # the device's next HELLO decides whether it rebooted or just reconnected
+        self.parser = FrameParser()
+        self._send(TYPE_SYNC, 0)
+
+    def _disconnect(self):
+        if self.serial is not None:
+            try:
+                self.serial.close()
+            except (serial.SerialException, OSError):
+                pass
+            self.serial = None
+
+    def run(self):
+        lost = False
+        while True:
+            try:
+                if self.serial is None:
+                    self._connect()
+                    if lost:
+                        print(f"{self.port}: reconnected")
+                        lost = False
+                data = self.serial.read(self.serial.in_waiting or 1)
+                if not data:
+                    continue
+                for frame_type, seq, payload in self.parser.feed(data):
+                    self.handle(frame_type, seq, payload)
+            except serial.SerialException as e:
+                self._disconnect()
+                if not lost:
+                    print(f"{self.port}: {e}; retrying every {RECONNECT_DELAY:g} s")
+                    lost = True
+                time.sleep(RECONNECT_DELAY)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Receive streamed QWST responses into CSV files")
+    parser.add_argument("--port", action="append", required=True,
+                        help="usb_cdc data port of a device (repeat for several devices)")
+    parser.add_argument("--out-dir", default=".", help="directory for the per-device CSV files")
+    args = parser.parse_args()
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    threads = []
+    for port in args.port:
+        receiver = DeviceReceiver(port, args.out_dir)
+        thread = threading.Thread(target=receiver.run, name=port, daemon=True)
+        thread.start()
+        threads.append(thread)
+    try:
+        for thread in threads:
+            thread.join()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
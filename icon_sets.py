@@ -0,0 +1,136 @@
+# ICON SETS
+#
+# Custom symbols for emoji_question (food portions, pain scales, ...), stored
+# on flash as one sprite sheet per set and only loaded when a question uses it.
+#
+#   /icons/<name>/iconset.json   {"file": "sheet.bmp", "tile_width": 36, "tile_height": 36,
+#                                 "labels": ["None", "Small", ...], "transparent": 0}
+#   /icons/<name>/sheet.bmp      indexed BMP, icons side by side - read with OnDiskBitmap,
+#                                so the pixels stay on flash and cost no RAM
+#   /icons/<name>/sheet.qrle     or run-length encoded sheet (see below), decoded into a
+#                                displayio.Bitmap on first use
+#
+# Decoded sheets are kept in a small LRU so switching between a couple of sets
+# does not decode them again. Make sheets with host/pack_icons.py.
+#
+# QRLE layout (little endian):
+#   "QRLE" | version u8 | palette size u8 | transparent index u8 (255 = none) | 0 u8 |
+#   width u16 | height u16 | palette RGB bytes | (count u8, index u8) runs
+# Runs never cross the end of a row.
+
+import json
+import struct
+import displayio
+import bitmaptools
+
+ICON_ROOT = "/icons"
+ICON_CACHE_SIZE = 2  # decoded sheets kept in RAM
+
+RLE_MAGIC = b"QRLE"
+RLE_HEADER = "<4sBBBBHH"
+RLE_HEADER_SIZE = 12
+NO_TRANSPARENCY = 255
+
+_sheet_cache = []  # [(path, bitmap, pixel_shader)], most recently used last
+
+
+def decode_rle(path):
+    """Read a .qrle sheet into a (Bitmap, Palette) pair."""
+    with open(path, "rb") as f:
+        header = f.read(RLE_HEADER_SIZE)
+        if len(header) != RLE_HEADER_SIZE:
+            raise ValueError(f"{path} is not a QRLE v1 sheet")
+        magic, version, colors, transparent, _, width, height = struct.unpack(RLE_HEADER, header)
+        if magic != RLE_MAGIC or version != 1 or not colors:
+            raise ValueError(f"{path} is not a QRLE v1 sheet")
+        palette = displayio.Palette(colors)
+        rgb = f.read(colors * 3)
+        if len(rgb) != colors * 3:
+            raise ValueError(f"{path} is truncated")
+        for i in range(colors):
+            palette[i] = (rgb[i * 3] << 16) | (rgb[i * 3 + 1] << 8) | rgb[i * 3 + 2]
+        if transparent != NO_TRANSPARENCY:
+            palette.make_transparent(transparent)
+        runs = f.read()
+
+    bitmap = displayio.Bitmap(width, height, colors)
+    x = y = 0
+    for i in range(0, len(runs) - 1, 2):
+        if y >= height:
+            break
+        count = runs[i]
+        value = runs[i + 1]
+        if x + count > width or value >= colors:
+            raise ValueError(f"{path} has a bad run at byte {RLE_HEADER_SIZE + colors * 3 + i}")
+        if value:
+            bitmaptools.fill_region(bitmap, x, y, x + count, y + 1, value)
+        x += count
+        if x >= width:
+            x = 0
+            y += 1
+    return bitmap, palette
+
+
+def load_sheet(path):
+    """Return (bitmap, pixel_shader) for a sheet, through the LRU cache."""
+    for i, entry in enumerate(_sheet_cache):
+        if entry[0] == path:
+            _sheet_cache.append(_sheet_cache.pop(i))
+            return entry[1], entry[2]
+
+    if path.endswith(".bmp"):
+        bitmap = displayio.OnDiskBitmap(path)
+        shader = bitmap.pixel_shader
+    else:
+        bitmap, shader = decode_rle(path)
+
+    _sheet_cache.append((path, bitmap, shader))
+    if len(_sheet_cache) > ICON_CACHE_SIZE:
+        # Screens still showing an evicted sheet keep their own reference
+        _sheet_cache.pop(0)
+    return bitmap, shader
+
+
+class IconSet:
+    """One named icon set. Only the small JSON is read until a sprite is needed."""
+
+    def __init__(self, name, root=ICON_ROOT):
+        self.name = name
+        self.directory = f"{root}/{name}"
+        with open(f"{self.directory}/iconset.json", "r") as f:
+            meta = json.load(f)
+        self.sheet_path = f"{self.directory}/{meta['file']}"
+        self.tile_width = meta["tile_width"]
+        self.tile_height = meta["tile_height"]
+        self.labels = meta.get("labels", [])
+        self.count = meta.get("count", len(self.labels))
+        self.transparent = meta.get("transparent")
+        if self.count < 1:
+            raise ValueError(f"icon set {name} has no icons")
+
+    def load(self):
+        """Load the sheet now and check it holds every icon, so a bad set fails
+        here rather than halfway through drawing a question."""
+        bitmap, _ = load_sheet(self.sheet_path)
+        if bitmap.width // self.tile_width < self.count or bitmap.height < self.tile_height:
+            raise ValueError(f"{self.sheet_path} is too small for {self.count} icons")
+
+    def sprite(self, index, x=0, y=0):
+        """A one-tile TileGrid showing icon number index."""
+        bitmap, shader = load_sheet(self.sheet_path)
+        if self.transparent is not None and self.sheet_path.endswith(".bmp"):
+            shader.make_transparent(self.transparent)
+        return displayio.TileGrid(bitmap, pixel_shader=shader, width=1, height=1,
+                                  tile_width=self.tile_width, tile_height=self.tile_height,
+                                  default_tile=index, x=x, y=y)
+
+    def label(self, index):
+        return self.labels[index] if index < len(self.labels) else "?"
+
+    def pick(self, count):
+        """Spread count choices evenly over the icons in the set."""
+        if count < 1 or self.count < 1:
+            raise ValueError("nothing to pick")
+        if count == 1 or self.count == 1:
+            return [0] * count
+        return [(i * (self.count - 1) + (count - 1) // 2) // (count - 1) for i in range(count)]
@@ -0,0 +1,114 @@
+# IDLE POWER MANAGEMENT
+#
+# Between respondents the device mostly sits on the welcome screen. The idle
+# manager slows the pad polling down, dims the backlight in stages and finally
+# light-sleeps, waking on a touch on A4 or a timer that checks the pad again.
+# Any button press goes straight back to full rate and brightness; when the
+# screen was too dark to read, that press is only a wake-up, not an answer.
+#
+# It also keeps time spent in each state and a rough energy estimate, using
+# the current draw figures below. Measure your own board and battery and
+# adjust them before trusting the mAh numbers.
+
+import time
+
+# (name, idle seconds before entering, poll interval or None for the caller's, brightness, est. mA)
+IDLE_STATES = (
+    ("active", 0, None, 1.0, 90),
+    ("dim", 30, 0.25, 0.3, 65),
+    ("dark", 120, 0.5, 0.05, 50),
+    ("sleep", 300, 1.0, 0.0, 12),
+)
+STATE_NAME = 0
+STATE_AFTER = 1
+STATE_POLL = 2
+STATE_BRIGHTNESS = 3
+STATE_MA = 4
+
+READABLE_BRIGHTNESS = 0.1  # below this the screen can't be read, so a press only wakes it
+
+
+class IdleManager:
+    """Step through IDLE_STATES while no buttons are pressed."""
+
+    def __init__(self, display, states=IDLE_STATES, touch_pin=None):
+        self.display = display
+        self.states = states
+        self.touch_pin = touch_pin
+        self.state = 0
+        self.seconds = [0.0] * len(states)
+        now = time.monotonic()
+        self._last_activity = now
+        self._state_since = now
+        self.display.brightness = states[0][STATE_BRIGHTNESS]
+
+    def _enter(self, index, now):
+        if index == self.state:
+            return
+        self.seconds[self.state] += now - self._state_since
+        self._state_since = now
+        self.state = index
+        self.display.brightness = self.states[index][STATE_BRIGHTNESS]
+        if index == len(self.states) - 1:
+            print(self.report())
+
+    @property
+    def readable(self):
+        return self.states[self.state][STATE_BRIGHTNESS] >= READABLE_BRIGHTNESS
+
+    def activity(self):
+        now = time.monotonic()
+        self._last_activity = now
+        self._enter(0, now)
+
+    def wait(self, button_state, interval):
+        """Sleep until the next pad poll; replaces time.sleep(interval) in the loops."""
+        now = time.monotonic()
+        if button_state:
+            self._last_activity = now
+            self._enter(0, now)
+        else:
+            idle = now - self._last_activity
+            index = self.state
+            while index + 1 < len(self.states) and idle >= self.states[index + 1][STATE_AFTER]:
+                index += 1
+            self._enter(index, now)
+
+        state = self.states[self.state]
+        poll = interval if state[STATE_POLL] is None else max(interval, state[STATE_POLL])
+        if self.state == len(self.states) - 1:
+            self._light_sleep(poll)
+        else:
+            time.sleep(poll)
+
+    def _light_sleep(self, duration):
+        try:
+            import alarm
+        except ImportError:
+            time.sleep(duration)
+            return
+
+        alarms = [alarm.time.TimeAlarm(monotonic_time=time.monotonic() + duration)]
+        if self.touch_pin is not None:
+            try:
+                alarms.append(alarm.touch.TouchAlarm(pin=self.touch_pin))
+            except (ValueError, RuntimeError, NotImplementedError):
+                # Pin busy (e.g. a touchio.TouchIn is open) or no touch wake here
+                self.touch_pin = None
+        woken_by = alarm.light_sleep_until_alarms(*alarms)
+        if self.touch_pin is not None and isinstance(woken_by, alarm.touch.TouchAlarm):
+            self.activity()
+
+    def totals(self):
+        """Seconds spent in each state so far, including the current one."""
+        seconds = list(self.seconds)
+        seconds[self.state] += time.monotonic() - self._state_since
+        return seconds
+
+    def energy_mah(self):
+        return sum(s * state[STATE_MA] for s, state in zip(self.totals(), self.states)) / 3600
+
+    def report(self):
+        seconds = self.totals()
+        parts = [f"{state[STATE_NAME]} {int(s)}s" for s, state in zip(seconds, self.states)]
+        return "Power: " + ", ".join(parts) + f", ~{self.energy_mah():.1f} mAh"
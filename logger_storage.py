@@ -0,0 +1,209 @@
+# LOGGING STORAGE BACKENDS
+#
+# Every confirmed answer ends up in one of these. display_and_gamepad.py picks a
+# backend at startup and the questions only ever call write_row()/flush().
+#
+#   FlashBackend   - /data_log.csv on the internal flash (needs boot.py logging mode)
+#   SDCardBackend  - CSV on the Adalogger FeatherWing SD card, rows batched in RAM
+#   MemoryBackend  - keeps rows in a list, for trying things out on a desktop Python
+
+import os
+import time
+
+CSV_HEADER = "timestamp,variable,score\n"
+SD_BLOCK_SIZE = 512
+
+# ----- PCF8523 RTC (Adalogger FeatherWing) -----
+PCF8523_ADDRESS = 0x68
+PCF8523_CONTROL_3 = 0x02
+PCF8523_SECONDS = 0x03
+
+
+def _bcd_to_int(value):
+    return (value >> 4) * 10 + (value & 0x0F)
+
+
+class PCF8523Clock:
+    """Read the time from the PCF8523 on the same I2C bus as the QwSTPad."""
+
+    def __init__(self, i2c, address=PCF8523_ADDRESS):
+        from adafruit_bus_device.i2c_device import I2CDevice
+
+        # I2CDevice locks the bus for each transaction, so this can share the
+        # busio.I2C object with the pad poller. Never create a second busio.I2C
+        # on SCL/SDA - the pins are already claimed.
+        self.device = I2CDevice(i2c, address)
+        self._register = bytearray([PCF8523_SECONDS])
+        self._buffer = bytearray(7)
+        # Battery switch-over is disabled from the factory; turn it on so the
+        # coin cell keeps the time when the Feather is unplugged.
+        with self.device:
+            self.device.write(bytearray([PCF8523_CONTROL_3, 0x00]))
+
+    def datetime(self):
+        """Return the RTC time as a time.struct_time."""
+        with self.device:
+            self.device.write_then_readinto(self._register, self._buffer)
+        b = self._buffer
+        if b[0] & 0x80:
+            # Oscillator-stopped flag: the time was lost and never set again
+            raise OSError("PCF8523 time not set")
+        return time.struct_time((
+            2000 + _bcd_to_int(b[6]),
+            _bcd_to_int(b[5] & 0x1F),
+            _bcd_to_int(b[3] & 0x3F),
+            _bcd_to_int(b[2] & 0x3F),
+            _bcd_to_int(b[1] & 0x7F),
+            _bcd_to_int(b[0] & 0x7F),
+            -1, -1, -1,
+        ))
+
+    def timestamp(self):
+        return time.mktime(self.datetime())
+
+    def sync_system_clock(self):
+        """Copy the RTC time into the microcontroller clock (time.localtime())."""
+        import rtc
+        rtc.RTC().datetime = self.datetime()
+
+
+# ----- Backends -----
+class CSVBackend:
+    """Shared header and timestamp handling for the CSV backends."""
+
+    def __init__(self, path, clock=None):
+        self.path = path
+        self.clock = clock
+        try:
+            try:
+                os.stat(self.path)
+            except OSError:
+                with open(self.path, "w") as f:
+                    f.write(CSV_HEADER)
+        except OSError as e:
+            print(f"⚠️ Cannot access filesystem: {e}")
+
+    def timestamp(self):
+        if self.clock is not None:
+            try:
+                return self.clock.timestamp()
+            except OSError as e:
+                print(f"⚠️ RTC read failed: {e}")
+        return time.mktime(time.localtime())
+
+    def sidecar_path(self, filename):
+        """Path for a small file kept next to the log (e.g. stats.json)."""
+        return self.path.rsplit("/", 1)[0] + "/" + filename
+
+    def format_row(self, timestamp, code, score):
+        return f"{timestamp},{code},{score}\n"
+
+    def write_row(self, timestamp, code, score):
+        raise NotImplementedError
+
+    @property
+    def pending(self):
+        """Bytes written with write_row() that are not on the card/flash yet."""
+        return 0
+
+    def flush(self, partial=True):
+        pass
+
+
+class FlashBackend(CSVBackend):
+    """Append each row straight to a CSV on the internal flash."""
+
+    def __init__(self, path="/data_log.csv", clock=None):
+        super().__init__(path, clock)
+
+    def write_row(self, timestamp, code, score):
+        with open(self.path, "a") as f:
+            f.write(self.format_row(timestamp, code, score))
+
+
+class SDCardBackend(CSVBackend):
+    """Buffer rows in RAM and append them to the SD card in batches.
+
+    When the buffer fills, only whole 512 byte blocks (aligned to the file) are
+    written and the tail stays in RAM. flush() writes the tail as well, which
+    leaves the end of the file mid-block.
+    """
+
+    def __init__(self, spi, cs, mount_point="/sd", filename="data_log.csv",
+                 clock=None, batch_blocks=8):
+        import sdcardio
+        import storage
+
+        # The TFT sits on the same SPI bus; sdcardio shares it with displayio.
+        self.card = sdcardio.SDCard(spi, cs)
+        self.vfs = storage.VfsFat(self.card)
+        storage.mount(self.vfs, mount_point)
+        self.mount_point = mount_point
+        super().__init__(mount_point + "/" + filename, clock)
+
+        # One spare block, so a full buffer always holds at least one whole
+        # aligned block whatever the file size is
+        self._buffer = bytearray((max(1, batch_blocks) + 1) * SD_BLOCK_SIZE)
+        self._used = 0
+        self._file_size = os.stat(self.path)[6]
+
+    def write_row(self, timestamp, code, score):
+        row = self.format_row(timestamp, code, score).encode()
+        if self._used + len(row) > len(self._buffer):
+            self._write_aligned()
+            if self._used + len(row) > len(self._buffer):
+                # Only for a row longer than a whole block
+                self.flush()
+        self._buffer[self._used:self._used + len(row)] = row
+        self._used += len(row)
+
+    def _write_aligned(self):
+        # Write only up to the next block boundary of the file so the card
+        # never has to read-modify-write a partially filled sector.
+        end = self._used - (self._file_size + self._used) % SD_BLOCK_SIZE
+        if end <= 0:
+            return
+        self._append(end)
+
+    def _append(self, count):
+        with open(self.path, "ab") as f:
+            f.write(memoryview(self._buffer)[:count])
+        self._file_size += count
+        remaining = self._used - count
+        self._buffer[:remaining] = self._buffer[count:self._used]
+        self._used = remaining
+
+    @property
+    def pending(self):
+        return self._used
+
+    def flush(self, partial=True):
+        """Write what is buffered; partial=False keeps the tail short of a block in RAM."""
+        if not partial:
+            self._write_aligned()
+        elif self._used:
+            self._append(self._used)
+
+
+class MemoryBackend(CSVBackend):
+    """Stand-in backend that keeps rows in memory, for desktop testing."""
+
+    def __init__(self, clock=None):
+        self.path = None
+        self.clock = clock
+        self.rows = []
+
+    def timestamp(self):
+        if self.clock is not None:
+            return self.clock.timestamp()
+        return int(time.time())
+
+    def sidecar_path(self, filename):
+        return None
+
+    def write_row(self, timestamp, code, score):
+        self.rows.append((timestamp, code, score))
+
+    def getvalue(self):
+        """Return the rows as they would appear in the CSV file."""
+        return CSV_HEADER + "".join(self.format_row(*row) for row in self.rows)
@@ -0,0 +1,117 @@
+# RUNNING RESPONSE STATISTICS
+#
+# Per-variable count, mean, min/max and a small histogram, updated in O(1) for
+# every confirmed answer. checkpoint() saves them to a tiny JSON sidecar next
+# to the log; call it once the counted rows are actually in the log. On
+# startup the sidecar is loaded instead of re-reading the whole CSV.
+
+import json
+import os
+
+MAX_BINS = 16  # distinct scores kept per variable; the rest are counted as "other"
+
+
+class VariableStats:
+    """Running aggregates for one variable_code."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+        self.histogram = {}
+        self.other = 0
+
+    def add(self, score, max_bins=MAX_BINS):
+        self.count += 1
+        self.total += score
+        if self.minimum is None or score < self.minimum:
+            self.minimum = score
+        if self.maximum is None or score > self.maximum:
+            self.maximum = score
+        if score in self.histogram:
+            self.histogram[score] += 1
+        elif len(self.histogram) < max_bins:
+            self.histogram[score] = 1
+        else:
+            self.other += 1
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+    def to_list(self):
+        return [self.count, self.total, self.minimum, self.maximum, self.other,
+                [[score, n] for score, n in self.histogram.items()]]
+
+    @classmethod
+    def from_list(cls, values):
+        stats = cls()
+        stats.count, stats.total, stats.minimum, stats.maximum, stats.other, bins = values
+        for score, n in bins:
+            stats.histogram[score] = n
+        return stats
+
+
+class ResponseStats:
+    """All variables, plus loading and saving the sidecar file."""
+
+    def __init__(self, path=None, checkpoint_every=None, max_bins=MAX_BINS):
+        # checkpoint_every=None: only save when checkpoint() is called
+        self.path = path
+        self.checkpoint_every = checkpoint_every
+        self.max_bins = max_bins
+        self.variables = {}
+        self.total = 0
+        self._unsaved = 0
+
+    def add(self, code, score):
+        stats = self.variables.get(code)
+        if stats is None:
+            stats = VariableStats()
+            self.variables[code] = stats
+        stats.add(score, self.max_bins)
+        self.total += 1
+        self._unsaved += 1
+        if self.checkpoint_every and self._unsaved >= self.checkpoint_every:
+            self.checkpoint()
+
+    def codes(self):
+        return sorted(self.variables)
+
+    def load(self):
+        """Restore from the sidecar (or its .tmp copy if a save was interrupted)."""
+        if self.path is None:
+            return
+        for path in (self.path, self.path + ".tmp"):
+            try:
+                with open(path, "r") as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            self.total = data["total"]
+            self.variables = {}
+            for code, values in data["variables"].items():
+                self.variables[code] = VariableStats.from_list(values)
+            return
+
+    def checkpoint(self):
+        if self.path is None or not self._unsaved:
+            return
+        data = {
+            "total": self.total,
+            "variables": {code: stats.to_list() for code, stats in self.variables.items()},
+        }
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            # FAT cannot rename over an existing file
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+            os.rename(tmp_path, self.path)
+            self._unsaved = 0
+        except OSError as e:
+            print(f"⚠️ Could not save stats: {e}")
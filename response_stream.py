@@ -0,0 +1,222 @@
+# RESPONSE STREAMING OVER USB CDC
+#
+# Sends each confirmed answer to a host over the usb_cdc data port as a small
+# binary frame. Used on the device by display_and_gamepad.py (ResponseStream)
+# and on the host by host/stream_receiver.py (FrameParser + helpers).
+#
+# Frame layout (little endian):
+#   A5 5A | type u8 | seq u16 | length u8 | payload | fletcher16 u16
+# The checksum covers type..payload.
+#
+# Device -> host
+#   DATA   seq = response sequence number, payload = timestamp u32, score i32, code
+#   HELLO  seq = oldest sequence number the host should expect,
+#          payload = session u32 (random per boot), device id
+# Host -> device
+#   ACK    seq = every frame up to and including seq has been written
+#   NAK    seq = next frame the host expects; resend from there
+#   SYNC   ask for a HELLO (receiver just started or lost track)
+
+import os
+import struct
+import time
+
+SYNC_BYTES = b"\xA5\x5A"
+HEADER_FORMAT = "<BHB"
+HEADER_SIZE = 4
+DATA_FORMAT = "<Ii"
+DATA_SIZE = 8
+HELLO_FORMAT = "<I"
+HELLO_SIZE = 4
+MAX_PAYLOAD = 255
+
+TYPE_DATA = 0x01
+TYPE_HELLO = 0x02
+TYPE_ACK = 0x10
+TYPE_NAK = 0x11
+TYPE_SYNC = 0x12
+
+SEQ_MASK = 0xFFFF
+
+
+def fletcher16(data):
+    sum1 = 0
+    sum2 = 0
+    for byte in data:
+        sum1 = (sum1 + byte) % 255
+        sum2 = (sum2 + sum1) % 255
+    return (sum2 << 8) | sum1
+
+
+def encode_frame(frame_type, seq, payload=b""):
+    body = struct.pack(HEADER_FORMAT, frame_type, seq & SEQ_MASK, len(payload)) + payload
+    return SYNC_BYTES + body + struct.pack("<H", fletcher16(body))
+
+
+def encode_response(timestamp, code, score):
+    code_bytes = code.encode()[:MAX_PAYLOAD - DATA_SIZE]
+    return struct.pack(DATA_FORMAT, int(timestamp), int(score)) + code_bytes
+
+
+def decode_response(payload):
+    """Return (timestamp, code, score) from a DATA payload."""
+    timestamp, score = struct.unpack(DATA_FORMAT, payload[:DATA_SIZE])
+    return timestamp, bytes(payload[DATA_SIZE:]).decode(), score
+
+
+def encode_hello(session, device_id):
+    return struct.pack(HELLO_FORMAT, session) + device_id
+
+
+def decode_hello(payload):
+    """Return (session, device_id) from a HELLO payload."""
+    session = struct.unpack(HELLO_FORMAT, payload[:HELLO_SIZE])[0]
+    return session, bytes(payload[HELLO_SIZE:])
+
+
+def _find_sync(buffer):
+    # bytearray.find() is not available on every CircuitPython build
+    for i in range(len(buffer) - 1):
+        if buffer[i] == 0xA5 and buffer[i + 1] == 0x5A:
+            return i
+    return -1
+
+
+class FrameParser:
+    """Reassemble frames from a byte stream, dropping anything corrupt."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def feed(self, data):
+        """Add received bytes and return a list of (type, seq, payload) frames."""
+        self._buffer.extend(data)
+        frames = []
+        while True:
+            start = _find_sync(self._buffer)
+            if start < 0:
+                # Keep a trailing A5 in case the 5A is still on its way
+                keep = 1 if self._buffer and self._buffer[-1] == 0xA5 else 0
+                self._buffer = self._buffer[len(self._buffer) - keep:]
+                return frames
+            if start:
+                self._buffer = self._buffer[start:]
+            if len(self._buffer) < 2 + HEADER_SIZE:
+                return frames
+            frame_type, seq, length = struct.unpack(HEADER_FORMAT, self._buffer[2:2 + HEADER_SIZE])
+            end = 2 + HEADER_SIZE + length
+            if len(self._buffer) < end + 2:
+                return frames
+            body = self._buffer[2:end]
+            checksum = struct.unpack("<H", self._buffer[end:end + 2])[0]
+            if checksum != fletcher16(body):
+                # Not a real frame start; resync on the next A5 5A
+                self._buffer = self._buffer[1:]
+                continue
+            frames.append((frame_type, seq, bytes(body[HEADER_SIZE:])))
+            self._buffer = self._buffer[end + 2:]
+
+
+class ResponseStream:
+    """Device side: send responses and keep unacknowledged frames in a ring buffer."""
+
+    def __init__(self, serial, device_id=b"", window=32, resend_timeout=2.0):
+        self.serial = serial
+        self.serial.timeout = 0
+        self.serial.write_timeout = 0
+        self.device_id = bytes(device_id)[:MAX_PAYLOAD - HELLO_SIZE]
+        # Lets the host tell a reboot (sequence numbers start again) from a
+        # repeated HELLO in the same session
+        self.session = struct.unpack(HELLO_FORMAT, os.urandom(HELLO_SIZE))[0]
+        self.window = window
+        self.resend_timeout = resend_timeout
+        self._frames = [None] * window
+        self._sent_at = [0.0] * window
+        self._base = 0       # oldest unacknowledged sequence number
+        self._next_seq = 0   # sequence number for the next response
+        self._parser = FrameParser()
+        self._read_buffer = bytearray(64)
+        self.dropped = 0
+        self._send_hello()
+
+    def _write(self, frame):
+        if not self.serial.connected:
+            return
+        try:
+            self.serial.write(frame)
+        except OSError:
+            pass
+
+    def _send_hello(self):
+        self._write(encode_frame(TYPE_HELLO, self._base, encode_hello(self.session, self.device_id)))
+
+    def _resend_from(self, seq):
+        now = time.monotonic()
+        for s in range(seq, self._next_seq):
+            slot = s % self.window
+            self._sent_at[slot] = now
+            self._write(self._frames[slot])
+
+    def _unwrap(self, wire_seq):
+        # Map a 16-bit sequence number from the host back onto the window
+        offset = (wire_seq - self._base) & SEQ_MASK
+        if offset <= self._next_seq - self._base:
+            return self._base + offset
+        return None
+
+    def send_response(self, timestamp, code, score):
+        if self._next_seq - self._base >= self.window:
+            # Host has not acknowledged for a whole window; the oldest frame
+            # only survives in the on-device log now.
+            self._frames[self._base % self.window] = None
+            self._base += 1
+            self.dropped += 1
+        slot = self._next_seq % self.window
+        frame = encode_frame(TYPE_DATA, self._next_seq, encode_response(timestamp, code, score))
+        self._frames[slot] = frame
+        self._sent_at[slot] = time.monotonic()
+        self._next_seq += 1
+        self._write(frame)
+
+    def poll(self):
+        """Handle ACK/NAK/SYNC from the host and resend anything overdue."""
+        waiting = self.serial.in_waiting
+        while waiting:
+            count = self.serial.readinto(self._read_buffer)
+            if not count:
+                break
+            for frame_type, seq, _ in self._parser.feed(memoryview(self._read_buffer)[:count]):
+                self._handle(frame_type, seq)
+            waiting = self.serial.in_waiting
+
+        if self._base < self._next_seq:
+            slot = self._base % self.window
+            if time.monotonic() - self._sent_at[slot] > self.resend_timeout:
+                self._resend_from(self._base)
+
+    def _handle(self, frame_type, wire_seq):
+        if frame_type == TYPE_ACK:
+            seq = self._unwrap(wire_seq)
+            if seq is not None and seq < self._next_seq:
+                for s in range(self._base, seq + 1):
+                    self._frames[s % self.window] = None
+                self._base = seq + 1
+        elif frame_type == TYPE_NAK:
+            seq = self._unwrap(wire_seq)
+            if seq is None:
+                # The host is expecting something we no longer have (or never
+                # sent, e.g. after a reset); tell it where the window starts.
+                self._send_hello()
+                seq = self._base
+            else:
+                for s in range(self._base, seq):
+                    self._frames[s % self.window] = None
+                self._base = seq
+            self._resend_from(seq)
+        elif frame_type == TYPE_SYNC:
+            self._send_hello()
+            self._resend_from(self._base)
+
+    @property
+    def pending(self):
+        return self._next_seq - self._base